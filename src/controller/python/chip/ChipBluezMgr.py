@@ -414,8 +414,8 @@ class BluezDbusDevice:
     def service_discover(self, gatt_dic):
         self.logger.info("Discovering services")
         try:
-            expired = time.time() + BLE_SERVICE_DISCOVERY_TIMEOUT_SEC
-            while time.time() < expired:
+            expired = time.monotonic() + BLE_SERVICE_DISCOVERY_TIMEOUT_SEC
+            while time.monotonic() < expired:
                 if self.ServicesResolved:
                     services = [
                         BluezDbusGattService(
@@ -613,8 +613,8 @@ class BluezDbusGattService:
 
     def find_characteristic(self, uuid):
         try:
-            expired = time.time() + BLE_CHAR_DISCOVERY_TIMEOUT_SEC
-            while time.time() < expired:
+            expired = time.monotonic() + BLE_CHAR_DISCOVERY_TIMEOUT_SEC
+            while time.monotonic() < expired:
                 characteristics = [
                     BluezDbusGattCharacteristic(
                         p["object"], self.bluez, self.bus, self.logger
@@ -949,11 +949,11 @@ class BluezManager(ChipBleBase):
         self.adapter.adapter_bg_scan(True)
         found = False
         identifier = kwargs["identifier"]
-        timeout = kwargs["timeout"] + time.time()
+        timeout = kwargs["timeout"] + time.monotonic()
         self.device_uuid_list = []
         self.peripheral_list = []
 
-        while time.time() < timeout:
+        while time.monotonic() < timeout:
             scanned_peripheral_list = self.adapter.find_devices(
                 [
                     chip_service,
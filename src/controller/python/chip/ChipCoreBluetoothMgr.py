@@ -109,11 +109,11 @@ def _VoidPtrToCBUUID(ptr, len):
 class LoopCondition:
     def __init__(self, op, timelimit, arg = None):
         self.op = op
-        self.due = time.time() + timelimit
+        self.due = time.monotonic() + timelimit
         self.arg = arg
     
     def TimeLimitExceeded(self):
-        return time.time() > self.due
+        return time.monotonic() > self.due
 
 class BlePeripheral:
     def __init__(self, peripheral, advData):
@@ -281,8 +281,13 @@ class ChipStack(object):
         while not self.completeEvent.isSet():
             if self.blockingCB:
                 self.blockingCB()
-
-            self.completeEvent.wait(0.05)
+                # Poll so that the blocking callback keeps getting serviced
+                # while the operation is outstanding.
+                self.completeEvent.wait(0.05)
+            else:
+                # Nothing to service while waiting; sleep until the operation
+                # completes instead of waking up every 50ms.
+                self.completeEvent.wait()
         if isinstance(self.callbackRes, ChipStackException):
             raise self.callbackRes
         return self.callbackRes
@@ -87,6 +87,7 @@ def DiscoverAsync(timeoutMs: int, scanCallback, doneCallback, adapter=None):
 
 @dataclass
 class DeviceInfo:
+    __slots__ = ("address", "discriminator", "vendor", "product")
     address: str
     discriminator: int
     vendor: int
@@ -27,12 +27,14 @@ from chip.discovery.types import DiscoverSuccessCallback_t, DiscoverFailureCallb
 @dataclass(unsafe_hash=True)
 class PeerId:
   """Represents a remote peer id."""
+  __slots__ = ("fabricId", "nodeId")
   fabricId: int
   nodeId: int
 
 @dataclass(unsafe_hash=True)
 class NodeAddress:
   """Represents a distinct address where a node can be reached."""
+  __slots__ = ("interface", "ip", "port")
   interface: int
   ip: str
   port: int
@@ -40,6 +42,7 @@ class NodeAddress:
 @dataclass
 class AggregatedDiscoveryResults:
   """Discovery results for a node."""
+  __slots__ = ("peerId", "addresses")
   peerId: PeerId
   addresses: Set[NodeAddress]
 
@@ -47,6 +50,7 @@ class AggregatedDiscoveryResults:
 @dataclass
 class PendingDiscovery:
   """Accumulator for ongoing discovery."""
+  __slots__ = ("result", "callback", "expireTime", "firstResultTime")
   result: AggregatedDiscoveryResults
   callback: Callable[[AggregatedDiscoveryResults], None]
   expireTime: int
@@ -73,7 +77,7 @@ class _PendingDiscoveries:
          PendingDiscovery(
            AggregatedDiscoveryResults(peerId, addresses = set()),
            callback = callback,
-           expireTime = time.time() + timeoutMs/1000.0,
+           expireTime = time.monotonic() + timeoutMs/1000.0,
            firstResultTime = 0,
        ))
        self.operationCondition.notify()
@@ -87,7 +91,7 @@ class _PendingDiscoveries:
       
         item.result.addresses.add(address)
         if item.firstResultTime == 0:
-          item.firstResultTime = time.time()
+          item.firstResultTime = time.monotonic()
       self.operationCondition.notify()
       
   
@@ -111,7 +115,7 @@ class _PendingDiscoveries:
 
   def NeedsCallback(self, item: PendingDiscovery):
     """Find out if the callback needs to be called for the given item."""
-    now = time.time()
+    now = time.monotonic()
     if item.expireTime <= now:
       return True
     
@@ -124,7 +128,7 @@ class _PendingDiscoveries:
     """Compute how much a thread needs to sleep based on the active discoveries list."""
     sleepTimeSec = 10.0  # just in case
 
-    now = time.time()
+    now = time.monotonic()
     for item in self.activeDiscoveries:
       # figure out expiry time for an item
       expireSleep = item.expireTime - now 
@@ -100,6 +100,26 @@ ElementTypes = {
     0x18: "End of Collection",
 }
 
+# Struct format and width for each fixed-size TLV element type, so that
+# TLVReader._decodeVal can decode scalars with a single table lookup instead
+# of walking a chain of type comparisons.
+ScalarTypeFormats = {
+    TLV_TYPE_SIGNED_INTEGER + 0: ("<b", 1),
+    TLV_TYPE_SIGNED_INTEGER + 1: ("<h", 2),
+    TLV_TYPE_SIGNED_INTEGER + 2: ("<l", 4),
+    TLV_TYPE_SIGNED_INTEGER + 3: ("<q", 8),
+    TLV_TYPE_UNSIGNED_INTEGER + 0: ("<B", 1),
+    TLV_TYPE_UNSIGNED_INTEGER + 1: ("<H", 2),
+    TLV_TYPE_UNSIGNED_INTEGER + 2: ("<L", 4),
+    TLV_TYPE_UNSIGNED_INTEGER + 3: ("<Q", 8),
+    TLV_TYPE_FLOATING_POINT_NUMBER + 0: ("<f", 4),
+    TLV_TYPE_FLOATING_POINT_NUMBER + 1: ("<d", 8),
+}
+
+# Struct format for a string-length field of 1, 2, 4 or 8 bytes, indexed by
+# the low two bits of the element type.
+StringLengthFormats = ("<B", "<H", "<L", "<Q")
+
 TagControls = {
     0x00: "Anonymous",
     0x20: "Context 1-byte",
@@ -190,7 +210,7 @@ class TLVWriter(object):
             self.putBytes(tag, val)
         elif isinstance(val, Mapping):
             self.startStructure(tag)
-            if type(val) == dict:
+            if type(val) is dict:
                 val = OrderedDict(
                     sorted(val.items(), key=lambda item: tlvTagToSortKey(item[0]))
                 )
@@ -426,6 +446,7 @@ class TLVReader(object):
         elementtypeIndex = controlByte & 0x1F
         decoding["type"] = ElementTypes[elementtypeIndex]
         self._bytesRead += 1
+        return (controlTypeIndex, elementtypeIndex)
 
     def _decodeControlAndTag(self, tlv, decoding):
         """The control byte specifies the type of a TLV element and how its tag, length and value fields are encoded.
@@ -434,160 +455,103 @@ class TLVReader(object):
         as well as how the corresponding length and value fields are encoded.  In the case of Booleans and the
         null value, the element type field also encodes the value itself."""
 
-        self._decodeControlByte(tlv, decoding)
+        (tagControl, elementType) = self._decodeControlByte(tlv, decoding)
 
-        if decoding["tagControl"] == "Anonymous":
+        if tagControl == TLV_TAG_CONTROL_ANONYMOUS:
             decoding["tag"] = None
             decoding["tagLen"] = 0
-        elif decoding["tagControl"] == "Context 1-byte":
+        elif tagControl == TLV_TAG_CONTROL_CONTEXT_SPECIFIC:
             (decoding["tag"],) = struct.unpack(
                 "<B", tlv[self._bytesRead : self._bytesRead + 1]
             )
             decoding["tagLen"] = 1
             self._bytesRead += 1
-        elif decoding["tagControl"] == "Common Profile 2-byte":
+        elif tagControl == TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes:
             profile = 0
             (tag,) = struct.unpack("<H", tlv[self._bytesRead : self._bytesRead + 2])
             decoding["profileTag"] = (profile, tag)
             decoding["tagLen"] = 2
             self._bytesRead += 2
-        elif decoding["tagControl"] == "Common Profile 4-byte":
+        elif tagControl == TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes:
             profile = 0
             (tag,) = struct.unpack("<L", tlv[self._bytesRead : self._bytesRead + 4])
             decoding["profileTag"] = (profile, tag)
             decoding["tagLen"] = 4
             self._bytesRead += 4
-        elif decoding["tagControl"] == "Implicit Profile 2-byte":
+        elif tagControl == TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes:
             profile = None
             (tag,) = struct.unpack("<H", tlv[self._bytesRead : self._bytesRead + 2])
             decoding["profileTag"] = (profile, tag)
             decoding["tagLen"] = 2
             self._bytesRead += 2
-        elif decoding["tagControl"] == "Implicit Profile 4-byte":
+        elif tagControl == TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes:
             profile = None
             (tag,) = struct.unpack("<L", tlv[self._bytesRead : self._bytesRead + 4])
             decoding["profileTag"] = (profile, tag)
             decoding["tagLen"] = 4
             self._bytesRead += 4
-        elif decoding["tagControl"] == "Fully Qualified 6-byte":
+        elif tagControl == TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes:
             (profile,) = struct.unpack("<L", tlv[self._bytesRead : self._bytesRead + 4])
             (tag,) = struct.unpack("<H", tlv[self._bytesRead + 4 : self._bytesRead + 6])
             decoding["profileTag"] = (profile, tag)
             decoding["tagLen"] = 2
             self._bytesRead += 6
-        elif decoding["tagControl"] == "Fully Qualified 8-byte":
+        elif tagControl == TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes:
             (profile,) = struct.unpack("<L", tlv[self._bytesRead : self._bytesRead + 4])
             (tag,) = struct.unpack("<L", tlv[self._bytesRead + 4 : self._bytesRead + 8])
             decoding["profileTag"] = (profile, tag)
             decoding["tagLen"] = 4
             self._bytesRead += 8
+        return elementType
 
-    def _decodeStrLength(self, tlv, decoding):
+    def _decodeStrLength(self, tlv, decoding, elementType):
         """UTF-8 or Byte StringLength fields are encoded in 0, 1, 2 or 4 byte widths, as specified by
         the element type field. If the element type needs a length field grab the next bytes as length"""
-        if "length" in decoding["type"]:
-            if "1-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<B", tlv[self._bytesRead : self._bytesRead + 1]
-                )
-                decoding["strDataLenLen"] = 1
-                self._bytesRead += 1
-            elif "2-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<H", tlv[self._bytesRead : self._bytesRead + 2]
-                )
-                decoding["strDataLenLen"] = 2
-                self._bytesRead += 2
-            elif "4-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<L", tlv[self._bytesRead : self._bytesRead + 4]
-                )
-                decoding["strDataLenLen"] = 4
-                self._bytesRead += 4
-            elif "8-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<Q", tlv[self._bytesRead : self._bytesRead + 8]
-                )
-                decoding["strDataLenLen"] = 8
-                self._bytesRead += 8
+        if TLV_TYPE_UTF8_STRING <= elementType < TLV_TYPE_NULL:
+            # The low two bits of a string element type select a 1, 2, 4 or
+            # 8 byte length field.
+            lenOfLen = 1 << (elementType & 0x3)
+            (decoding["strDataLen"],) = struct.unpack(
+                StringLengthFormats[elementType & 0x3],
+                tlv[self._bytesRead : self._bytesRead + lenOfLen],
+            )
+            decoding["strDataLenLen"] = lenOfLen
+            self._bytesRead += lenOfLen
         else:
             decoding["strDataLen"] = 0
             decoding["strDataLenLen"] = 0
 
-    def _decodeVal(self, tlv, decoding):
+    def _decodeVal(self, tlv, decoding, elementType):
         """decode primitive tlv value to the corresponding python value, tlv array and path are decoded as
         python list, tlv structure is decoded as python dictionary"""
-        if decoding["type"] == "Structure":
+        scalarFormat = ScalarTypeFormats.get(elementType)
+        if scalarFormat is not None:
+            (fmt, length) = scalarFormat
+            (decoding["value"],) = struct.unpack(
+                fmt, tlv[self._bytesRead : self._bytesRead + length]
+            )
+            self._bytesRead += length
+        elif elementType == TLV_TYPE_STRUCTURE:
             decoding["value"] = {}
             decoding["Structure"] = []
             self._get(tlv, decoding["Structure"], decoding["value"])
-        elif decoding["type"] == "Array":
+        elif elementType == TLV_TYPE_ARRAY:
             decoding["value"] = []
             decoding["Array"] = []
             self._get(tlv, decoding["Array"], decoding["value"])
-        elif decoding["type"] == "Path":
+        elif elementType == TLV_TYPE_PATH:
             decoding["value"] = []
             decoding["Path"] = []
             self._get(tlv, decoding["Path"], decoding["value"])
-        elif decoding["type"] == "Null":
+        elif elementType == TLV_TYPE_NULL:
             decoding["value"] = None
-        elif decoding["type"] == "End of Collection":
+        elif elementType == TLVEndOfContainer:
             decoding["value"] = None
-        elif decoding["type"] == "Boolean True":
+        elif elementType == TLVBoolean_True:
             decoding["value"] = True
-        elif decoding["type"] == "Boolean False":
+        elif elementType == TLVBoolean_False:
             decoding["value"] = False
-        elif decoding["type"] == "Unsigned Integer 1-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<B", tlv[self._bytesRead : self._bytesRead + 1]
-            )
-            self._bytesRead += 1
-        elif decoding["type"] == "Signed Integer 1-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<b", tlv[self._bytesRead : self._bytesRead + 1]
-            )
-            self._bytesRead += 1
-        elif decoding["type"] == "Unsigned Integer 2-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<H", tlv[self._bytesRead : self._bytesRead + 2]
-            )
-            self._bytesRead += 2
-        elif decoding["type"] == "Signed Integer 2-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<h", tlv[self._bytesRead : self._bytesRead + 2]
-            )
-            self._bytesRead += 2
-        elif decoding["type"] == "Unsigned Integer 4-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<L", tlv[self._bytesRead : self._bytesRead + 4]
-            )
-            self._bytesRead += 4
-        elif decoding["type"] == "Signed Integer 4-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<l", tlv[self._bytesRead : self._bytesRead + 4]
-            )
-            self._bytesRead += 4
-        elif decoding["type"] == "Unsigned Integer 8-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<Q", tlv[self._bytesRead : self._bytesRead + 8]
-            )
-            self._bytesRead += 8
-        elif decoding["type"] == "Signed Integer 8-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<q", tlv[self._bytesRead : self._bytesRead + 8]
-            )
-            self._bytesRead += 8
-        elif decoding["type"] == "Floating Point 4-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<f", tlv[self._bytesRead : self._bytesRead + 4]
-            )
-            self._bytesRead += 4
-        elif decoding["type"] == "Floating Point 8-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<d", tlv[self._bytesRead : self._bytesRead + 8]
-            )
-            self._bytesRead += 8
-        elif "UTF-8 String" in decoding["type"]:
+        elif TLV_TYPE_UTF8_STRING <= elementType < TLV_TYPE_BYTE_STRING:
             (val,) = struct.unpack(
                 "<%ds" % decoding["strDataLen"],
                 tlv[self._bytesRead : self._bytesRead + decoding["strDataLen"]],
@@ -597,7 +561,7 @@ class TLVReader(object):
             except Exception as ex:
                 decoding["value"] = val
             self._bytesRead += decoding["strDataLen"]
-        elif "Byte String" in decoding["type"]:
+        elif TLV_TYPE_BYTE_STRING <= elementType < TLV_TYPE_NULL:
             (val,) = struct.unpack(
                 "<%ds" % decoding["strDataLen"],
                 tlv[self._bytesRead : self._bytesRead + decoding["strDataLen"]],
@@ -611,19 +575,19 @@ class TLVReader(object):
     def _get(self, tlv, decodings, out):
         endOfEncoding = False
 
-        while len(tlv[self._bytesRead :]) > 0 and endOfEncoding == False:
+        while self._bytesRead < len(tlv) and endOfEncoding == False:
             decoding = {}
-            self._decodeControlAndTag(tlv, decoding)
-            self._decodeStrLength(tlv, decoding)
-            self._decodeVal(tlv, decoding)
+            elementType = self._decodeControlAndTag(tlv, decoding)
+            self._decodeStrLength(tlv, decoding, elementType)
+            self._decodeVal(tlv, decoding, elementType)
             decodings.append(decoding)
 
-            if decoding["type"] == "End of Collection":
+            if elementType == TLVEndOfContainer:
                 endOfEncoding = True
             else:
-                if "profileTag" in list(decoding.keys()):
+                if "profileTag" in decoding:
                     out[decoding["profileTag"]] = decoding["value"]
-                elif "tag" in list(decoding.keys()):
+                elif "tag" in decoding:
                     if decoding["tag"] is not None:
                         out[decoding["tag"]] = decoding["value"]
                     else:
@@ -17,7 +17,7 @@ logger.addHandler(sh)
 
 
 def TestFail(message):
-    logger.fatal("Testfail: {}".format(message))
+    logger.fatal("Testfail: %s", message)
     os._exit(1)
 
 
@@ -40,14 +40,14 @@ class TestTimeout(threading.Thread):
         self.join()
 
     def run(self):
-        stop_time = time.time() + self._timeout
-        logger.info("Test timeout set to {} seconds".format(self._timeout))
+        stop_time = time.monotonic() + self._timeout
+        logger.info("Test timeout set to %s seconds", self._timeout)
         with self._cv:
-            wait_time = stop_time - time.time()
+            wait_time = stop_time - time.monotonic()
             while wait_time > 0 and not self._should_stop:
                 self._cv.wait(wait_time)
-                wait_time = stop_time - time.time()
-        if time.time() > stop_time:
+                wait_time = stop_time - time.monotonic()
+        if time.monotonic() > stop_time:
             TestFail("Timeout")
 
 
@@ -58,16 +58,16 @@ class BaseTestHelper:
         self.logger = logger
 
     def TestKeyExchange(self, ip: str, setuppin: int, nodeid: int):
-        self.logger.info("Conducting key exchange with device {}".format(ip))
+        self.logger.info("Conducting key exchange with device %s", ip)
         if not self.devCtrl.ConnectIP(ip.encode("utf-8"), setuppin, nodeid):
             self.logger.info(
-                "Failed to finish key exchange with device {}".format(ip))
+                "Failed to finish key exchange with device %s", ip)
             return False
         self.logger.info("Device finished key exchange.")
         return True
 
     def TestNetworkCommissioning(self, nodeid: int, endpoint: int, group: int, dataset: str, network_id: str):
-        self.logger.info("Commissioning network to device {}".format(nodeid))
+        self.logger.info("Commissioning network to device %s", nodeid)
         try:
             self.devCtrl.ZCLSend("NetworkCommissioning", "AddThreadNetwork", nodeid, endpoint, group, {
                 "operationalDataset": bytes.fromhex(dataset),
@@ -77,7 +77,7 @@ class BaseTestHelper:
             self.logger.exception("Failed to send AddThreadNetwork command")
             return False
         self.logger.info(
-            "Send EnableNetwork command to device {}".format(nodeid))
+            "Send EnableNetwork command to device %s", nodeid)
         try:
             self.devCtrl.ZCLSend("NetworkCommissioning", "EnableNetwork", nodeid, endpoint, group, {
                 "networkID": bytes.fromhex(network_id),
@@ -90,28 +90,28 @@ class BaseTestHelper:
 
     def TestOnOffCluster(self, nodeid: int, endpoint: int, group: int):
         self.logger.info(
-            "Sending On/Off commands to device {} endpoint {}".format(nodeid, endpoint))
+            "Sending On/Off commands to device %s endpoint %s", nodeid, endpoint)
         err, resp = self.devCtrl.ZCLSend("OnOff", "On", nodeid,
                                          endpoint, group, {}, blocking=True)
         if err != 0 or resp is None or resp.ProtocolCode != 0:
             self.logger.error(
-                "failed to send OnOff.On: error is {} with im response{}".format(err, resp))
+                "failed to send OnOff.On: error is %s with im response%s", err, resp)
             return False
         err, resp = self.devCtrl.ZCLSend("OnOff", "Off", nodeid,
                                          endpoint, group, {}, blocking=True)
         if err != 0 or resp is None or resp.ProtocolCode != 0:
             self.logger.error(
-                "failed to send OnOff.Off: error is {} with im response {}".format(err, resp))
+                "failed to send OnOff.Off: error is %s with im response %s", err, resp)
             return False
         return True
 
     def TestResolve(self, fabricid, nodeid):
         self.logger.info(
-            "Resolve {} with fabric id: {}".format(nodeid, fabricid))
+            "Resolve %s with fabric id: %s", nodeid, fabricid)
         try:
             self.devCtrl.ResolveNode(fabricid=fabricid, nodeid=nodeid)
         except Exception as ex:
-            self.logger.exception("Failed to resolve. {}".format(ex))
+            self.logger.exception("Failed to resolve. %s", ex)
 
     def TestReadBasicAttribiutes(self, nodeid: int, endpoint: int, group: int):
         basic_cluster_attrs = [
@@ -138,7 +138,7 @@ class BaseTestHelper:
             except Exception:
                 failed_zcl.append(basic_attr)
         if failed_zcl:
-            self.logger.exception(f"Following attributes failed: {failed_zcl}")
+            self.logger.exception("Following attributes failed: %s", failed_zcl)
             return False
         return True
 
@@ -159,6 +159,6 @@ class BaseTestHelper:
             except Exception:
                 failed_zcl.append(basic_attr)
         if failed_zcl:
-            self.logger.exception(f"Following attributes failed: {failed_zcl}")
+            self.logger.exception("Following attributes failed: %s", failed_zcl)
             return False
         return True
@@ -27,6 +27,7 @@
 
 from __future__ import absolute_import
 from __future__ import print_function
+import functools
 import sys
 from six.moves import range
 
@@ -40,10 +41,12 @@ CharSet_Base16 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 CharSet_Base32 = "0123456789ABCDEFGHJKLMNPRSTUVWXY" # Excludes I, O, Q and Z
 CharSet_Base36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
-PermTable_Base10 = [ 1,   5,  7,  6,  2,  8,  3,  0,  9,  4 ]
-PermTable_Base16 = [ 4,   7,  5, 14,  8, 12, 15,  0,  2, 11,  3, 13, 10,  6,  9,  1 ]
-PermTable_Base32 = [ 7,   2,  1, 30, 16, 20, 27, 11, 31,  6,  8, 13, 29,  5, 10, 21, 22,  3, 24,  0, 23, 25, 12,  9, 28, 14,  4, 15, 17, 18, 19, 26 ]
-PermTable_Base36 = [ 29,  0, 32, 11, 35, 20,  7, 27,  2,  4, 19, 28, 30,  1,  5, 12,  3,  9, 16, 22,  6, 33,  8, 24, 26, 21, 14, 10, 34, 31, 15, 25, 17, 13, 23, 18 ]
+# NOTE: Tuples, not lists, so that they are hashable and _ComputeCheckChar
+#       calls can be memoized.
+PermTable_Base10 = ( 1,   5,  7,  6,  2,  8,  3,  0,  9,  4 )
+PermTable_Base16 = ( 4,   7,  5, 14,  8, 12, 15,  0,  2, 11,  3, 13, 10,  6,  9,  1 )
+PermTable_Base32 = ( 7,   2,  1, 30, 16, 20, 27, 11, 31,  6,  8, 13, 29,  5, 10, 21, 22,  3, 24,  0, 23, 25, 12,  9, 28, 14,  4, 15, 17, 18, 19, 26 )
+PermTable_Base36 = ( 29,  0, 32, 11, 35, 20,  7, 27,  2,  4, 19, 28, 30,  1,  5, 12,  3,  9, 16, 22,  6, 33,  8, 24, 26, 21, 14, 10, 34, 31, 15, 25, 17, 13, 23, 18 )
 
 def DihedralMultiply(x, y, n):
 	n2 = n * 2
@@ -70,49 +73,122 @@ def DihedralInvert(val, n):
 
 def Permute(val, permTable, iterCount):
 	val = val % len(permTable);
-	if (iterCount == 0):
-		return val
-	else:
-		return Permute(permTable[val], permTable, iterCount - 1)
-
+	while (iterCount > 0):
+		val = permTable[val]
+		iterCount = iterCount - 1
+	return val
+
+def _BuildPermPowers(permTable):
+	# Table of permutation powers such that powers[k][v] == P^k(v).  The table
+	# covers one full cycle of the permutation, so P^i == powers[i % len(powers)].
+	identity = tuple(range(len(permTable)))
+	powers = [identity]
+	power = tuple(permTable)
+	while (power != identity):
+		powers.append(power)
+		power = tuple(permTable[v] for v in power)
+	return powers
+
+_PermPowersCache = {}
+
+def _PermPowers(permTable):
+	powers = _PermPowersCache.get(permTable)
+	if powers is None:
+		powers = _BuildPermPowers(permTable)
+		_PermPowersCache[permTable] = powers
+	return powers
+
+_DihedralMulCache = {}
+
+def _DihedralMulTable(n):
+	# Full 2n x 2n multiplication table for the dihedral group D_n, so the hot
+	# loop replaces the branchy DihedralMultiply arithmetic with two indexes.
+	table = _DihedralMulCache.get(n)
+	if table is None:
+		n2 = n * 2
+		table = tuple(tuple(DihedralMultiply(x, y, n) for y in range(n2)) for x in range(n2))
+		_DihedralMulCache[n] = table
+	return table
+
+_DihedralInvCache = {}
+
+def _DihedralInvTable(n):
+	# Inverse table for the dihedral group D_n, indexed by value in [0, 2n).
+	table = _DihedralInvCache.get(n)
+	if table is None:
+		table = tuple(DihedralInvert(val, n) for val in range(n * 2))
+		_DihedralInvCache[n] = table
+	return table
+
+_CharValsCache = {}
+
+def _CharVals(charSet):
+	# Map of character to its value in charSet, so that the per-character
+	# lookup is a single dict probe instead of an O(radix) str.index scan.
+	vals = _CharValsCache.get(charSet)
+	if vals is None:
+		vals = dict((ch, val) for val, ch in enumerate(charSet))
+		_CharValsCache[charSet] = vals
+	return vals
+
+@functools.lru_cache(maxsize=4096)
 def _ComputeCheckChar(str, strLen, polygonSize, permTable, charSet):
 	str = str.upper()
+	permPowers = _PermPowers(permTable)
+	numPowers = len(permPowers)
+	permLen = len(permTable)
+	charVals = _CharVals(charSet)
+	dihedralMul = _DihedralMulTable(polygonSize)
 	c = 0
-	for i in range(1, strLen+1):
-		ch = str[strLen - i]
-		val = charSet.index(ch)
-		p = Permute(val, permTable, i)
-		c = DihedralMultiply(c, p, polygonSize)
-	c = DihedralInvert(c, polygonSize)
+	# Walk the string right-to-left in a single fused pass over the tables.
+	for i, ch in enumerate(str[:strLen][::-1], 1):
+		val = charVals.get(ch)
+		if val is None:
+			raise ValueError("invalid character '%s' for charset" % ch)
+		c = dihedralMul[c][permPowers[i % numPowers][val % permLen]]
+	c = _DihedralInvTable(polygonSize)[c]
 	return charSet[c]
 
+# (polygonSize, permTable) for each supported base; the charSet comes from
+# the wrapper so callers can still override it.
+_BaseParams = {
+	10 : ( 5, PermTable_Base10),
+	16 : ( 8, PermTable_Base16),
+	32 : (16, PermTable_Base32),
+	36 : (18, PermTable_Base36),
+}
+
+def _ComputeCheckCharForBase(str, strLen, base, charSet):
+	(polygonSize, permTable) = _BaseParams[base]
+	return _ComputeCheckChar(str, strLen, polygonSize, permTable, charSet)
+
+def _VerifyCheckCharForBase(str, base, charSet):
+	expectedCheckCh = _ComputeCheckCharForBase(str, len(str)-1, base, charSet)
+	return str[-1] == expectedCheckCh
+
 def ComputeCheckChar(str, charSet=CharSet_Base10):
-	return _ComputeCheckChar(str, len(str), polygonSize=5, permTable=PermTable_Base10, charSet=charSet)
+	return _ComputeCheckCharForBase(str, len(str), 10, charSet)
 
 def VerifyCheckChar(str, charSet=CharSet_Base10):
-	expectedCheckCh = _ComputeCheckChar(str, len(str)-1, polygonSize=5, permTable=PermTable_Base10, charSet=CharSet_Base10)
-	return str[-1] == expectedCheckCh  
+	return _VerifyCheckCharForBase(str, 10, CharSet_Base10)
 
 def ComputeCheckChar16(str, charSet=CharSet_Base16):
-	return _ComputeCheckChar(str, len(str), polygonSize=8, permTable=PermTable_Base16, charSet=charSet)
+	return _ComputeCheckCharForBase(str, len(str), 16, charSet)
 
 def VerifyCheckChar16(str, charSet=CharSet_Base16):
-	expectedCheckCh = _ComputeCheckChar(str, len(str)-1, polygonSize=8, permTable=PermTable_Base16, charSet=charSet)
-	return str[-1] == expectedCheckCh  
+	return _VerifyCheckCharForBase(str, 16, charSet)
 
 def ComputeCheckChar32(str, charSet=CharSet_Base32):
-	return _ComputeCheckChar(str, len(str), polygonSize=16, permTable=PermTable_Base32, charSet=charSet)
+	return _ComputeCheckCharForBase(str, len(str), 32, charSet)
 
 def VerifyCheckChar32(str, charSet=CharSet_Base32):
-	expectedCheckCh = _ComputeCheckChar(str, len(str)-1, polygonSize=16, permTable=PermTable_Base32, charSet=charSet)
-	return str[-1] == expectedCheckCh  
+	return _VerifyCheckCharForBase(str, 32, charSet)
 
 def ComputeCheckChar36(str, charSet=CharSet_Base36):
-	return _ComputeCheckChar(str, len(str), polygonSize=18, permTable=PermTable_Base36, charSet=charSet)
+	return _ComputeCheckCharForBase(str, len(str), 36, charSet)
 
 def VerifyCheckChar36(str, charSet=CharSet_Base36):
-	expectedCheckCh = _ComputeCheckChar(str, len(str)-1, polygonSize=18, permTable=PermTable_Base36, charSet=charSet)
-	return str[-1] == expectedCheckCh  
+	return _VerifyCheckCharForBase(str, 36, charSet)
 
 
 if __name__ == "__main__":
@@ -52,10 +52,13 @@ class ChipTest(Chip):
         else:
             self.jitter_distribution_curve = None
 
-    def start_chip_process(self, node_id, cmd, tag, quiet=None, strace=True, env={}, sync_on_output=None, rootMode=False):
+    def start_chip_process(self, node_id, cmd, tag, quiet=None, strace=True, env=None, sync_on_output=None, rootMode=False):
         emsg = "start_chip_process %s at %s node." % (tag, node_id)
         self.logger.debug("[%s] ChipTest: %s" % (node_id, emsg))
 
+        if env is None:
+            env = {}
+
         options = happy.HappyProcessStart.option()
         options["node_id"] = node_id
         options["tag"] = tag
@@ -84,7 +87,7 @@ class ChipTest(Chip):
         stop_server = happy.HappyProcessStop.HappyProcessStop(options)
         stop_server.run()
 
-    def start_simple_chip_server(self, cmd_path, server_addr, node_id, tag, quiet=None, listen=True, strace=True, env={},
+    def start_simple_chip_server(self, cmd_path, server_addr, node_id, tag, quiet=None, listen=True, strace=True, env=None,
                                  sync_on_output=gready_to_service_events_str, use_persistent_storage=True, reset_persistent_storage=True):
         cmd = cmd_path
 
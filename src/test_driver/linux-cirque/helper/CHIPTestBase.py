@@ -84,7 +84,7 @@ class CHIPVirtualHome:
             traceback.print_exc(file=sys.stderr)
         return test_ret
 
-    def query_api(self, end_point, args=[], binary=False):
+    def query_api(self, end_point, args=None, binary=False):
         ret = requests.get(self._build_request_url(end_point, args))
         if binary:
             return ret.content
@@ -307,8 +307,8 @@ class CHIPVirtualHome:
                 self.logger.error(note)
             raise AssertionError
 
-    def _build_request_url(self, end_point, args=[]):
-        if len(args) == 0:
+    def _build_request_url(self, end_point, args=None):
+        if not args:
             return urljoin(self.cirque_url, end_point)
         return urljoin(self.cirque_url, "{}/{}".format(end_point, '/'.join([str(argv) for argv in args])))
 